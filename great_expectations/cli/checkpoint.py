@@ -1,5 +1,8 @@
+import copy
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from great_expectations import DataContext
@@ -8,7 +11,9 @@ from great_expectations.cli.mark import Mark as mark
 from great_expectations.cli.util import cli_message, cli_message_list
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.usage_statistics.usage_statistics import send_usage_message
+from great_expectations.data_context.store import TupleFilesystemStoreBackend
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.datasource import PandasDatasource
 from great_expectations.exceptions import DataContextError
 from great_expectations.util import lint_code
 from ruamel.yaml import YAML
@@ -83,7 +88,11 @@ def checkpoint_new(checkpoint, suite, directory, datasource):
 def _verify_checkpoint_does_not_exist(
     context: DataContext, checkpoint: str, usage_event: str
 ) -> None:
-    if checkpoint in context.list_checkpoints():
+    # A single stat is enough here; listing the checkpoints directory is not needed
+    checkpoint_file = os.path.join(
+        context.root_directory, context.CHECKPOINTS_DIR, f"{checkpoint}.yml"
+    )
+    if os.path.isfile(checkpoint_file):
         toolkit.exit_with_failure_message_and_stats(
             context,
             usage_event,
@@ -104,10 +113,18 @@ def _write_checkpoint_to_disk(
 
 
 def _load_checkpoint_yml_template() -> dict:
+    # The cached template is shared, so callers get a copy they can mutate
+    return copy.deepcopy(_parse_checkpoint_yml_template())
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_checkpoint_yml_template() -> dict:
     # TODO this should be the responsibility of the DataContext
     template_file = file_relative_path(
         __file__, os.path.join("..", "data_context", "checkpoint_template.yml")
     )
+    # The round-trip loader is required here so template comments survive the
+    # dump in _write_checkpoint_to_disk; read-only loads use the safe loader.
     with open(template_file, "r") as f:
         template = yaml.load(f)
     return template
@@ -159,25 +176,57 @@ def checkpoint_run(checkpoint, directory):
     checkpoint_config = toolkit.load_checkpoint(context, checkpoint, usage_event)
     checkpoint_file = f"great_expectations/checkpoints/{checkpoint}.yml"
 
-    # TODO loading batches will move into DataContext eventually
-    batches_to_validate = []
     for batch in checkpoint_config["batches"]:
         _validate_at_least_one_suite_is_listed(context, batch, checkpoint_file)
+    suite_map = _load_expectation_suites(
+        context,
+        [
+            suite_name
+            for batch in checkpoint_config["batches"]
+            for suite_name in batch["expectation_suite_names"]
+        ],
+        usage_event,
+    )
+
+    # TODO loading batches will move into DataContext eventually
+    suites_and_batch_kwargs = []
+    for batch in checkpoint_config["batches"]:
         batch_kwargs = batch["batch_kwargs"]
         for suite_name in batch["expectation_suite_names"]:
-            suite = toolkit.load_expectation_suite(context, suite_name, usage_event)
-            try:
-                batch = toolkit.load_batch(context, suite, batch_kwargs)
-            except (FileNotFoundError, SQLAlchemyError, IOError, DataContextError) as e:
-                toolkit.exit_with_failure_message_and_stats(
-                    context,
-                    usage_event,
-                    f"""<red>There was a problem loading a batch:
+            suites_and_batch_kwargs.append((suite_map[suite_name], batch_kwargs))
+
+    batch_kwargs_list = [batch_kwargs for _, batch_kwargs in suites_and_batch_kwargs]
+    if _can_load_batches_concurrently(context, batch_kwargs_list):
+        # Reading local files is I/O bound, so these batches are loaded
+        # concurrently. Errors are reported from this thread in checkpoint order.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(32, len(suites_and_batch_kwargs)))
+        ) as executor:
+            futures = [
+                executor.submit(toolkit.load_batch, context, suite, batch_kwargs)
+                for suite, batch_kwargs in suites_and_batch_kwargs
+            ]
+        batch_loaders = [future.result for future in futures]
+    else:
+        batch_loaders = [
+            functools.partial(toolkit.load_batch, context, suite, batch_kwargs)
+            for suite, batch_kwargs in suites_and_batch_kwargs
+        ]
+
+    batches_to_validate = []
+    for (_, batch_kwargs), load_batch in zip(suites_and_batch_kwargs, batch_loaders):
+        try:
+            batch = load_batch()
+        except (FileNotFoundError, SQLAlchemyError, IOError, DataContextError) as e:
+            toolkit.exit_with_failure_message_and_stats(
+                context,
+                usage_event,
+                f"""<red>There was a problem loading a batch:
   - Batch: {batch_kwargs}
   - {e}
   - Please verify these batch kwargs in the checkpoint file: `{checkpoint_file}`</red>""",
-                )
-            batches_to_validate.append(batch)
+            )
+        batches_to_validate.append(batch)
     try:
         results = context.run_validation_operator(
             checkpoint_config["validation_operator_name"],
@@ -200,6 +249,81 @@ def checkpoint_run(checkpoint, directory):
     sys.exit(0)
 
 
+def _can_load_batches_concurrently(
+    context: DataContext, batch_kwargs_list: list
+) -> bool:
+    """Only pandas batches read from a local path are safe to load from several threads.
+
+    Other datasources share state that is not thread safe (SQL connection pools
+    and the temp tables created on them, or the boto3 default session), so
+    they are loaded serially. Datasources are resolved here, on the main thread,
+    so worker threads only read the DataContext's datasource cache.
+    """
+    for batch_kwargs in batch_kwargs_list:
+        if "path" not in batch_kwargs:
+            return False
+        try:
+            datasource = context.get_datasource(batch_kwargs.get("datasource"))
+        except Exception:
+            # Loading serially reports the error the same way as before
+            return False
+        if not isinstance(datasource, PandasDatasource):
+            return False
+    return True
+
+
+def _load_expectation_suites(
+    context: DataContext, suite_names: list, usage_event: str
+) -> dict:
+    """Load each distinct suite once, keyed by the name used in the checkpoint."""
+    suite_names = list(dict.fromkeys(suite_names))
+    if _can_load_suites_concurrently(context):
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(32, len(suite_names)))
+        ) as executor:
+            futures = [
+                executor.submit(_get_expectation_suite_or_none, context, suite_name)
+                for suite_name in suite_names
+            ]
+        suite_loaders = [future.result for future in futures]
+    else:
+        suite_loaders = [
+            functools.partial(
+                toolkit.load_expectation_suite, context, suite_name, usage_event
+            )
+            for suite_name in suite_names
+        ]
+
+    suite_map = {}
+    for suite_name, load_suite in zip(suite_names, suite_loaders):
+        suite = load_suite()
+        if suite is None:
+            # Load again from this thread so the missing suite is reported
+            # (and the command exits) the same way as everywhere else.
+            suite = toolkit.load_expectation_suite(context, suite_name, usage_event)
+        suite_map[suite_name] = suite
+    return suite_map
+
+
+def _can_load_suites_concurrently(context: DataContext) -> bool:
+    """Only suites read from the local filesystem are loaded from several threads.
+
+    Other store backends are not thread safe, e.g. the S3 backend creates its
+    boto3 clients from the default session.
+    """
+    expectations_store = context.stores[context.expectations_store_name]
+    return isinstance(expectations_store.store_backend, TupleFilesystemStoreBackend)
+
+
+def _get_expectation_suite_or_none(context: DataContext, suite_name: str):
+    try:
+        return context.get_expectation_suite(
+            toolkit.strip_json_suffix_from_suite_name(suite_name)
+        )
+    except DataContextError:
+        return None
+
+
 @checkpoint.command(name="script")
 @click.argument("checkpoint")
 @click.option(
@@ -208,8 +332,13 @@ def checkpoint_run(checkpoint, directory):
     default=None,
     help="The project's great_expectations directory.",
 )
+@click.option(
+    "--lint/--no-lint",
+    help="Format the generated script with black. By default the script is written as templated.",
+    default=False,
+)
 @mark.cli_as_experimental
-def checkpoint_script(checkpoint, directory):
+def checkpoint_script(checkpoint, directory, lint):
     """
     Create a python script to run a checkpoint. (Experimental)
 
@@ -236,7 +365,9 @@ def checkpoint_script(checkpoint, directory):
   - Existing file path: {script_path}""",
         )
 
-    _write_checkpoint_script_to_disk(context.root_directory, checkpoint, script_path)
+    _write_checkpoint_script_to_disk(
+        context.root_directory, checkpoint, script_path, lint=lint
+    )
     cli_message(
         f"""<green>A python script was created that runs the checkpoint named: `{checkpoint}`</green>
   - The script is located in `great_expectations/uncommitted/run_{checkpoint}.py`
@@ -260,6 +391,7 @@ def _validate_at_least_one_suite_is_listed(
         )
 
 
+@functools.lru_cache(maxsize=1)
 def _load_script_template() -> str:
     with open(file_relative_path(__file__, "checkpoint_script_template.py")) as f:
         template = f.read()
@@ -267,10 +399,13 @@ def _load_script_template() -> str:
 
 
 def _write_checkpoint_script_to_disk(
-    context_directory: str, checkpoint_name: str, script_path: str
+    context_directory: str, checkpoint_name: str, script_path: str, lint: bool = False
 ) -> None:
     script_full_path = os.path.abspath(os.path.join(script_path))
-    template = _load_script_template().format(checkpoint_name, context_directory)
-    linted_code = lint_code(template)
+    code = _load_script_template().format(checkpoint_name, context_directory)
+    # The template itself is black-formatted, so linting is opt-in. It still
+    # rewraps lines that a long checkpoint name or directory makes too long.
+    if lint:
+        code = lint_code(code)
     with open(script_full_path, "w") as f:
-        f.write(linted_code)
+        f.write(code)
@@ -233,6 +233,13 @@ def load_batch(
     return batch
 
 
+def strip_json_suffix_from_suite_name(suite_name: str) -> str:
+    """Suite names may be given as the name of the suite's json file."""
+    if suite_name.endswith(".json"):
+        suite_name = suite_name[:-5]
+    return suite_name
+
+
 def load_expectation_suite(
     # TODO consolidate all the myriad CLI tests into this
     context: DataContext,
@@ -245,8 +252,7 @@ def load_expectation_suite(
     Handles a suite name with or without `.json`
     :param usage_event:
     """
-    if suite_name.endswith(".json"):
-        suite_name = suite_name[:-5]
+    suite_name = strip_json_suffix_from_suite_name(suite_name)
     try:
         suite = context.get_expectation_suite(suite_name)
         return suite
@@ -8,11 +8,6 @@ from great_expectations.datasource.batch_kwargs_generator.batch_kwargs_generator
 from great_expectations.datasource.types import S3BatchKwargs
 from great_expectations.exceptions import BatchKwargsError, GreatExpectationsError
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None
-
 
 logger = logging.getLogger(__name__)
 
@@ -96,8 +91,11 @@ class S3GlobReaderBatchKwargsGenerator(BatchKwargsGenerator):
         self._max_keys = max_keys
         self._iterators = {}
         try:
+            # boto3 is imported here rather than at module load to keep it out of CLI startup
+            import boto3
+
             self._s3 = boto3.client("s3", **boto3_options)
-        except TypeError:
+        except ImportError:
             raise (
                 ImportError(
                     "Unable to load boto3, which is required for S3 batch kwargs generator"
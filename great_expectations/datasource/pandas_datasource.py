@@ -1,23 +1,59 @@
-import datetime
+import copy
+import importlib.util
+import inspect
 import logging
+import os
+import threading
 import uuid
-from functools import partial
-from io import StringIO
+from collections import OrderedDict
+from functools import lru_cache, partial
+from io import BytesIO
 
 import pandas as pd
 from great_expectations.core.batch import Batch
 from great_expectations.datasource.types import BatchMarkers
 from great_expectations.exceptions import BatchKwargsError
-from great_expectations.types import ClassConfig
 
-from ..types.configurations import classConfigSchema
+from ..types.configurations import dump_class_config
 from .datasource import Datasource
-from .util import S3Url, hash_pandas_dataframe
+from .util import (
+    S3Url,
+    get_ge_load_time,
+    hash_pandas_dataframe,
+    sample_hash_pandas_dataframe,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+# Fingerprints of file-sourced batches, keyed on the file's stat and reader configuration. The least recently used
+# entries are evicted once PATH_FINGERPRINT_CACHE_SIZE is reached, since every change to a file adds a new key.
+PATH_FINGERPRINT_CACHE_SIZE = 1024
+_path_fingerprints = OrderedDict()
+_path_fingerprints_lock = threading.Lock()
+
+# Reader configuration guessed from a path's extension; compound extensions are checked first
+EXTENSION_READER_METHODS = {
+    ".csv": {"reader_method": "read_csv"},
+    ".tsv": {"reader_method": "read_csv", "reader_options": {"sep": "\t"}},
+    ".parquet": {"reader_method": "read_parquet"},
+    ".xlsx": {"reader_method": "read_excel"},
+    ".xls": {"reader_method": "read_excel"},
+    ".json": {"reader_method": "read_json"},
+    ".pkl": {"reader_method": "read_pickle"},
+}
+COMPOUND_EXTENSION_READER_METHODS = {
+    ".csv.gz": {"reader_method": "read_csv", "reader_options": {"compression": "gzip"}},
+    ".tsv.gz": {
+        "reader_method": "read_csv",
+        "reader_options": {"compression": "gzip", "sep": "\t"},
+    },
+}
+
+# pandas readers that parse text and therefore accept an encoding option
+TEXT_READER_METHODS = {"read_csv", "read_table", "read_fwf", "read_json"}
+
 
 class PandasDatasource(Datasource):
     """The PandasDatasource produces PandasDataset objects and supports generators capable of
@@ -41,6 +77,7 @@ class PandasDatasource(Datasource):
         reader_method=None,
         reader_options=None,
         limit=None,
+        use_s3fs_for_parquet=False,
         **kwargs
     ):
         """
@@ -53,6 +90,8 @@ class PandasDatasource(Datasource):
             reader_method: Optional default reader_method for generated batches
             reader_options: Optional default reader_options for generated batches
             limit: Optional default limit for generated batches
+            use_s3fs_for_parquet: Read s3 parquet objects with pandas from their s3:// url (requires s3fs). \
+                boto3_options are passed to s3fs as client_kwargs unless the batch sets storage_options.
             **kwargs: Additional kwargs to be part of the datasource constructor's initialization
 
         Returns:
@@ -66,7 +105,7 @@ class PandasDatasource(Datasource):
                 "module_name": "great_expectations.dataset",
             }
         else:
-            data_asset_type = classConfigSchema.dump(ClassConfig(**data_asset_type))
+            data_asset_type = dump_class_config(data_asset_type)
 
         configuration = kwargs
         configuration["data_asset_type"] = data_asset_type
@@ -97,6 +136,9 @@ class PandasDatasource(Datasource):
         if limit is not None:
             configuration["limit"] = limit
 
+        if use_s3fs_for_parquet:
+            configuration["use_s3fs_for_parquet"] = True
+
         return configuration
 
     def __init__(
@@ -109,6 +151,7 @@ class PandasDatasource(Datasource):
         reader_method=None,
         reader_options=None,
         limit=None,
+        use_s3fs_for_parquet=False,
         **kwargs
     ):
         configuration_with_defaults = PandasDatasource.build_configuration(
@@ -118,6 +161,7 @@ class PandasDatasource(Datasource):
             reader_method=reader_method,
             reader_options=reader_options,
             limit=limit,
+            use_s3fs_for_parquet=use_s3fs_for_parquet,
             **kwargs
         )
 
@@ -138,6 +182,11 @@ class PandasDatasource(Datasource):
         self._reader_method = configuration_with_defaults.get("reader_method", None)
         self._reader_options = configuration_with_defaults.get("reader_options", None)
         self._limit = configuration_with_defaults.get("limit", None)
+        self._use_s3fs_for_parquet = configuration_with_defaults.get(
+            "use_s3fs_for_parquet", False
+        )
+        # Resolved reader functions, keyed on reader_method and path-guessed reader_options
+        self._reader_fn_cache = {}
 
     def process_batch_parameters(
         self, reader_method=None, reader_options=None, limit=None, dataset_options=None,
@@ -147,28 +196,24 @@ class PandasDatasource(Datasource):
             dataset_options=dataset_options
         )
 
-        # Apply globally-configured reader options first
+        # Apply globally-configured reader options first, then any locally-specified ones
+        reader_options_update = dict()
         if self._reader_options:
-            # Then update with any locally-specified reader options
-            if not batch_kwargs.get("reader_options"):
-                batch_kwargs["reader_options"] = dict()
-            batch_kwargs["reader_options"].update(self._reader_options)
+            reader_options_update.update(self._reader_options)
 
-        # Then update with any locally-specified reader options
         if reader_options:
-            if not batch_kwargs.get("reader_options"):
-                batch_kwargs["reader_options"] = dict()
-            batch_kwargs["reader_options"].update(reader_options)
+            reader_options_update.update(reader_options)
 
         if self._limit:
-            if not batch_kwargs.get("reader_options"):
-                batch_kwargs["reader_options"] = dict()
-            batch_kwargs["reader_options"]["nrows"] = self._limit
+            reader_options_update["nrows"] = self._limit
 
         if limit is not None:
+            reader_options_update["nrows"] = limit
+
+        if reader_options_update:
             if not batch_kwargs.get("reader_options"):
                 batch_kwargs["reader_options"] = dict()
-            batch_kwargs["reader_options"]["nrows"] = limit
+            batch_kwargs["reader_options"].update(reader_options_update)
 
         if self._reader_method:
             batch_kwargs["reader_method"] = self._reader_method
@@ -182,51 +227,87 @@ class PandasDatasource(Datasource):
         # We will use and manipulate reader_options along the way
         reader_options = batch_kwargs.get("reader_options", {})
 
+        path_fingerprint_key = None
+        in_memory = False
+        sample_fingerprint = False
+
         # We need to build a batch_markers to be used in the dataframe
-        batch_markers = BatchMarkers(
-            {"ge_load_time": datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S.%fZ")}
-        )
+        batch_markers = BatchMarkers({"ge_load_time": get_ge_load_time()})
 
         if "path" in batch_kwargs:
             path = batch_kwargs["path"]
             reader_method = batch_kwargs.get("reader_method")
-            reader_fn = self._get_reader_fn(reader_method, path)
+            reader_fn = self._get_reader_fn(reader_method, path, reader_options)
             df = reader_fn(path, **reader_options)
+            path_fingerprint_key = _get_path_fingerprint_key(
+                path, reader_method, reader_options
+            )
 
         elif "s3" in batch_kwargs:
-            try:
-                import boto3
-
-                s3 = boto3.client("s3", **self._boto3_options)
-            except ImportError:
-                raise BatchKwargsError(
-                    "Unable to load boto3 client to read s3 asset.", batch_kwargs
-                )
             raw_url = batch_kwargs["s3"]
-            reader_method = batch_kwargs.get("reader_method")
             url = S3Url(raw_url)
-            logger.debug(
-                "Fetching s3 object. Bucket: %s Key: %s" % (url.bucket, url.key)
-            )
-            s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
-            reader_fn = self._get_reader_fn(reader_method, url.key)
-            df = reader_fn(
-                StringIO(
-                    s3_object["Body"]
-                    .read()
-                    .decode(s3_object.get("ContentEncoding", "utf-8"))
-                ),
-                **reader_options
-            )
+            reader_method = batch_kwargs.get("reader_method")
+            reader_fn = self._get_reader_fn(reader_method, url.key, reader_options)
+            if reader_method is None:
+                reader_method = self.guess_reader_method_from_path(url.key)[
+                    "reader_method"
+                ]
+
+            if reader_method == "read_parquet" and self._use_s3fs_for_parquet:
+                # Reading through s3fs only fetches the row groups and columns pandas asks for
+                if not _can_read_parquet_from_s3_url():
+                    raise BatchKwargsError(
+                        "use_s3fs_for_parquet requires s3fs and a pandas version whose read_parquet accepts "
+                        "storage_options.",
+                        batch_kwargs,
+                    )
+                logger.debug(
+                    "Reading s3 parquet object. Bucket: %s Key: %s"
+                    % (url.bucket, url.key)
+                )
+                if "storage_options" not in reader_options:
+                    reader_options = dict(reader_options)
+                    reader_options["storage_options"] = {
+                        "client_kwargs": self._boto3_options
+                    }
+                df = reader_fn("s3://%s/%s" % (url.bucket, url.key), **reader_options)
+
+            else:
+                try:
+                    import boto3
+
+                    s3 = boto3.client("s3", **self._boto3_options)
+                except ImportError:
+                    raise BatchKwargsError(
+                        "Unable to load boto3 client to read s3 asset.", batch_kwargs
+                    )
+                logger.debug(
+                    "Fetching s3 object. Bucket: %s Key: %s" % (url.bucket, url.key)
+                )
+                s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
+                if (
+                    reader_method in TEXT_READER_METHODS
+                    and "encoding" not in reader_options
+                ):
+                    # Let pandas decode the raw bytes instead of decoding them here first
+                    reader_options = dict(reader_options)
+                    reader_options["encoding"] = s3_object.get(
+                        "ContentEncoding", "utf-8"
+                    )
+                df = reader_fn(BytesIO(s3_object["Body"].read()), **reader_options)
 
         elif "dataset" in batch_kwargs and isinstance(
             batch_kwargs["dataset"], (pd.DataFrame, pd.Series)
         ):
             df = batch_kwargs.get("dataset")
             # We don't want to store the actual dataframe in kwargs; copy the remaining batch_kwargs
-            batch_kwargs = {k: batch_kwargs[k] for k in batch_kwargs if k != "dataset"}
+            batch_kwargs = dict(batch_kwargs)
+            batch_kwargs.pop("dataset")
             batch_kwargs["PandasInMemoryDF"] = True
-            batch_kwargs["ge_batch_id"] = str(uuid.uuid1())
+            in_memory = True
+            batch_kwargs["ge_batch_id"] = str(uuid.uuid4())
+            # In-memory data gets a sampled fingerprint unless a full one is requested
+            sample_fingerprint = not batch_kwargs.get("full_fingerprint", False)
 
         else:
             raise BatchKwargsError(
@@ -234,8 +315,26 @@ class PandasDatasource(Datasource):
                 batch_kwargs,
             )
 
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        if in_memory:
+            # The caller owns an in-memory dataframe, so its fingerprint is only
+            # computed if the marker is read and describes the data at that point
+            if sample_fingerprint:
+                batch_markers.set_lazy(
+                    "pandas_data_fingerprint",
+                    lambda df=df: sample_hash_pandas_dataframe(df),
+                )
+            elif _approx_memory_usage(df) < HASH_THRESHOLD:
+                batch_markers.set_lazy(
+                    "pandas_data_fingerprint", lambda df=df: hash_pandas_dataframe(df)
+                )
+        else:
+            fingerprint = _get_path_fingerprint(path_fingerprint_key)
+            if fingerprint is None and _approx_memory_usage(df) < HASH_THRESHOLD:
+                # Loaded data is hashed now, before the dataset built on it can be modified
+                fingerprint = hash_pandas_dataframe(df)
+                _set_path_fingerprint(path_fingerprint_key, fingerprint)
+            if fingerprint is not None:
+                batch_markers["pandas_data_fingerprint"] = fingerprint
 
         return Batch(
             datasource_name=self.name,
@@ -248,33 +347,28 @@ class PandasDatasource(Datasource):
 
     @staticmethod
     def guess_reader_method_from_path(path):
-        if path.endswith(".csv") or path.endswith(".tsv"):
-            return {"reader_method": "read_csv"}
-        elif path.endswith(".parquet"):
-            return {"reader_method": "read_parquet"}
-        elif path.endswith(".xlsx") or path.endswith(".xls"):
-            return {"reader_method": "read_excel"}
-        elif path.endswith(".json"):
-            return {"reader_method": "read_json"}
-        elif path.endswith(".pkl"):
-            return {"reader_method": "read_pickle"}
-        elif path.endswith(".csv.gz") or path.endswith(".csv.gz"):
-            return {
-                "reader_method": "read_csv",
-                "reader_options": {"compression": "gzip"},
-            }
+        lower_path = path.lower()
+        for extension, reader in COMPOUND_EXTENSION_READER_METHODS.items():
+            if lower_path.endswith(extension):
+                return copy.deepcopy(reader)
+
+        reader = EXTENSION_READER_METHODS.get(os.path.splitext(lower_path)[1])
+        if reader is not None:
+            return copy.deepcopy(reader)
 
         raise BatchKwargsError(
             "Unable to determine reader method from path: %s" % path, {"path": path}
         )
 
-    def _get_reader_fn(self, reader_method=None, path=None):
+    def _get_reader_fn(self, reader_method=None, path=None, reader_options=None):
         """Static helper for parsing reader types. If reader_method is not provided, path will be used to guess the
         correct reader_method.
 
         Args:
             reader_method (str): the name of the reader method to use, if available.
             path (str): the to use to guess
+            reader_options (dict): the options the reader will be called with; a guessed sep is not applied if \
+                these already set a delimiter
 
         Returns:
             ReaderMethod to use for the filepath
@@ -286,21 +380,85 @@ class PandasDatasource(Datasource):
                 {"reader_method": reader_method},
             )
 
-        reader_options = None
+        guessed_options = None
         if reader_method is None:
             path_guess = self.guess_reader_method_from_path(path)
             reader_method = path_guess["reader_method"]
-            reader_options = path_guess.get(
+            guessed_options = path_guess.get(
                 "reader_options"
             )  # This may not be there; use None in that case
+            # pandas rejects sep and delimiter together; an explicit delimiter wins
+            if guessed_options and "delimiter" in (reader_options or {}):
+                guessed_options.pop("sep", None)
+
+        cache_key = (reader_method, tuple(sorted((guessed_options or {}).items())))
+        if cache_key in self._reader_fn_cache:
+            return self._reader_fn_cache[cache_key]
 
         try:
             reader_fn = getattr(pd, reader_method)
-            if reader_options:
-                reader_fn = partial(reader_fn, **reader_options)
-            return reader_fn
+            if guessed_options:
+                reader_fn = partial(reader_fn, **guessed_options)
         except AttributeError:
             raise BatchKwargsError(
                 "Unable to find reader_method %s in pandas." % reader_method,
                 {"reader_method": reader_method},
             )
+        self._reader_fn_cache[cache_key] = reader_fn
+        return reader_fn
+
+
+@lru_cache(maxsize=1)
+def _can_read_parquet_from_s3_url():
+    """Whether pandas can read parquet straight from an s3:// url, which needs s3fs and storage_options support."""
+    return (
+        importlib.util.find_spec("s3fs") is not None
+        and "storage_options" in inspect.signature(pd.read_parquet).parameters
+    )
+
+
+def _approx_memory_usage(df):
+    """Estimate the size in bytes of a dataframe or series from its length and dtypes.
+
+    Object values are counted as pointers, which is enough to compare against HASH_THRESHOLD.
+    """
+    dtypes = [df.dtype] if isinstance(df, pd.Series) else df.dtypes
+    return len(df) * sum(getattr(dtype, "itemsize", 8) for dtype in dtypes)
+
+
+def _get_path_fingerprint(path_fingerprint_key):
+    if path_fingerprint_key is None:
+        return None
+    with _path_fingerprints_lock:
+        fingerprint = _path_fingerprints.get(path_fingerprint_key)
+        if fingerprint is not None:
+            _path_fingerprints.move_to_end(path_fingerprint_key)
+    return fingerprint
+
+
+def _set_path_fingerprint(path_fingerprint_key, fingerprint):
+    if path_fingerprint_key is None:
+        return
+    with _path_fingerprints_lock:
+        _path_fingerprints[path_fingerprint_key] = fingerprint
+        _path_fingerprints.move_to_end(path_fingerprint_key)
+        while len(_path_fingerprints) > PATH_FINGERPRINT_CACHE_SIZE:
+            _path_fingerprints.popitem(last=False)
+
+
+def _get_path_fingerprint_key(path, reader_method, reader_options):
+    """Build a key identifying the data read from path, or None if path is not a local file.
+
+    The file's mtime and size stand in for its content, so an unchanged file is only hashed once per process.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (
+        path,
+        stat.st_mtime_ns,
+        stat.st_size,
+        reader_method,
+        repr(sorted(reader_options.items())),
+    )
@@ -1,15 +1,14 @@
-import datetime
 import logging
 import uuid
 
 from great_expectations.datasource.types import BatchMarkers
-from great_expectations.types import ClassConfig
 
 from ..core.batch import Batch
 from ..dataset import SparkDFDataset
 from ..exceptions import BatchKwargsError
-from ..types.configurations import classConfigSchema
+from ..types.configurations import dump_class_config
 from .datasource import Datasource
+from .util import get_ge_load_time
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +67,7 @@ class SparkDFDatasource(Datasource):
                 "module_name": "great_expectations.dataset",
             }
         else:
-            data_asset_type = classConfigSchema.dump(ClassConfig(**data_asset_type))
+            data_asset_type = dump_class_config(data_asset_type)
 
         if spark_config is None:
             spark_config = {}
@@ -157,9 +156,7 @@ class SparkDFDatasource(Datasource):
         reader_options = batch_kwargs.get("reader_options", {})
 
         # We need to build batch_markers to be used with the DataFrame
-        batch_markers = BatchMarkers(
-            {"ge_load_time": datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S.%fZ")}
-        )
+        batch_markers = BatchMarkers({"ge_load_time": get_ge_load_time()})
 
         if "path" in batch_kwargs or "s3" in batch_kwargs:
             # If both are present, let s3 override
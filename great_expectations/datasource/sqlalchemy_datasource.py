@@ -1,4 +1,3 @@
-import datetime
 import logging
 from string import Template
 
@@ -7,9 +6,9 @@ from great_expectations.core.util import nested_update
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.datasource import Datasource
 from great_expectations.datasource.types import BatchMarkers
+from great_expectations.datasource.util import get_ge_load_time
 from great_expectations.exceptions import DatasourceInitializationError
-from great_expectations.types import ClassConfig
-from great_expectations.types.configurations import classConfigSchema
+from great_expectations.types.configurations import dump_class_config
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +56,7 @@ class SqlAlchemyDatasource(Datasource):
                 "module_name": "great_expectations.dataset",
             }
         else:
-            data_asset_type = classConfigSchema.dump(ClassConfig(**data_asset_type))
+            data_asset_type = dump_class_config(data_asset_type)
 
         configuration = kwargs
         configuration["data_asset_type"] = data_asset_type
@@ -159,9 +158,7 @@ class SqlAlchemyDatasource(Datasource):
 
     def get_batch(self, batch_kwargs, batch_parameters=None):
         # We need to build a batch_id to be used in the dataframe
-        batch_markers = BatchMarkers(
-            {"ge_load_time": datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S.%fZ")}
-        )
+        batch_markers = BatchMarkers({"ge_load_time": get_ge_load_time()})
 
         if "bigquery_temp_table" in batch_kwargs:
             query_support_table_name = batch_kwargs.get("bigquery_temp_table")
@@ -1,4 +1,5 @@
 import logging
+import threading
 from abc import ABCMeta
 
 from great_expectations.core.id_dict import BatchKwargs
@@ -16,6 +17,124 @@ class BatchMarkers(BatchKwargs):
         super(BatchMarkers, self).__init__(*args, **kwargs)
         if "ge_load_time" not in self:
             raise InvalidBatchIdError("BatchMarkers requires a ge_load_time")
+        self._lazy_markers = {}
+        self._lazy_markers_lock = threading.RLock()
+
+    def set_lazy(self, key, compute):
+        """Add a marker whose value is computed by calling ``compute`` the first time it is read.
+
+        The key is visible immediately and the computed value is cached. Until then the underlying dict holds
+        None, so only code that bypasses the dict methods (e.g. the C-level PyDict API) can observe the placeholder.
+        """
+        with self._lazy_markers_lock:
+            self._lazy_markers[key] = compute
+            super(BatchMarkers, self).__setitem__(key, None)
+
+    def _resolve(self, key):
+        # The value is stored before the callable is dropped, so a key that is
+        # no longer pending always holds its real value.
+        if key not in self._lazy_markers:
+            return
+        with self._lazy_markers_lock:
+            compute = self._lazy_markers.get(key)
+            if compute is not None:
+                super(BatchMarkers, self).__setitem__(key, compute())
+                del self._lazy_markers[key]
+
+    def _resolve_all(self):
+        with self._lazy_markers_lock:
+            for key in list(self._lazy_markers):
+                self._resolve(key)
+
+    def __getitem__(self, key):
+        self._resolve(key)
+        return super(BatchMarkers, self).__getitem__(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    # Writes drop any pending callable so it cannot later replace the new value
+    def __setitem__(self, key, value):
+        with self._lazy_markers_lock:
+            self._lazy_markers.pop(key, None)
+            super(BatchMarkers, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lazy_markers_lock:
+            self._lazy_markers.pop(key, None)
+            super(BatchMarkers, self).__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        with self._lazy_markers_lock:
+            for key in other:
+                self._lazy_markers.pop(key, None)
+            super(BatchMarkers, self).update(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        with self._lazy_markers_lock:
+            if key in self:
+                return self[key]
+            return super(BatchMarkers, self).setdefault(key, default)
+
+    def pop(self, key, *args):
+        with self._lazy_markers_lock:
+            self._resolve(key)
+            return super(BatchMarkers, self).pop(key, *args)
+
+    def popitem(self):
+        with self._lazy_markers_lock:
+            self._resolve_all()
+            return super(BatchMarkers, self).popitem()
+
+    def clear(self):
+        with self._lazy_markers_lock:
+            self._lazy_markers.clear()
+            super(BatchMarkers, self).clear()
+
+    # Operations that expose every value resolve all lazy markers first
+    def __iter__(self):
+        self._resolve_all()
+        return super(BatchMarkers, self).__iter__()
+
+    def items(self):
+        self._resolve_all()
+        return super(BatchMarkers, self).items()
+
+    def values(self):
+        self._resolve_all()
+        return super(BatchMarkers, self).values()
+
+    def copy(self):
+        self._resolve_all()
+        return super(BatchMarkers, self).copy()
+
+    def __or__(self, other):
+        self._resolve_all()
+        return super(BatchMarkers, self).__or__(other)
+
+    def __eq__(self, other):
+        self._resolve_all()
+        if isinstance(other, BatchMarkers):
+            other._resolve_all()
+        return super(BatchMarkers, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._resolve_all()
+        return super(BatchMarkers, self).__repr__()
+
+    def __reduce__(self):
+        # Copies and pickles are rebuilt from the resolved values; the lock cannot be pickled
+        return self.__class__, (dict(self.items()),)
 
     @property
     def ge_load_time(self):
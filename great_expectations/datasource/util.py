@@ -1,5 +1,6 @@
 import hashlib
 import pickle
+import time
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -50,11 +51,42 @@ class S3Url(object):
         return self._parsed.geturl()
 
 
+def get_ge_load_time():
+    """Return the current UTC time formatted as "%Y%m%dT%H%M%S.%fZ" for the ge_load_time batch marker.
+
+    Equivalent to datetime.datetime.utcnow().strftime(...), but avoids building a datetime object on every batch load.
+    """
+    seconds, microseconds = divmod(int(round(time.time() * 1e6)), 1000000)
+    return (
+        time.strftime("%Y%m%dT%H%M%S", time.gmtime(seconds)) + ".%06dZ" % microseconds
+    )
+
+
 def hash_pandas_dataframe(df):
     try:
-        obj = pd.util.hash_pandas_object(df, index=True).values
+        # categorize hashes each distinct object value once and then works on integer codes
+        obj = pd.util.hash_pandas_object(df, index=True, categorize=True).values
     except TypeError:
         # In case of facing unhashable objects (like dict), use pickle
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def sample_hash_pandas_dataframe(df, sample_rows=1024):
+    """Cheap structural fingerprint of a dataframe built from its shape, dtypes and first and last rows.
+
+    Unlike hash_pandas_dataframe, changes to rows outside the sampled head and tail are not detected.
+    """
+    if len(df) <= 2 * sample_rows:
+        return hash_pandas_dataframe(df)
+
+    fingerprint = hashlib.md5()
+    fingerprint.update(str(df.shape).encode("utf-8"))
+    if isinstance(df, pd.DataFrame):
+        fingerprint.update(repr(list(df.dtypes.items())).encode("utf-8"))
+    else:
+        fingerprint.update(repr((df.name, df.dtype)).encode("utf-8"))
+    fingerprint.update(hash_pandas_dataframe(df.head(sample_rows)).encode("utf-8"))
+    fingerprint.update(hash_pandas_dataframe(df.tail(sample_rows)).encode("utf-8"))
+    return fingerprint.hexdigest()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from marshmallow import Schema, fields
 
 
@@ -23,3 +25,17 @@ class ClassConfigSchema(Schema):
 
 
 classConfigSchema = ClassConfigSchema()
+
+
+def dump_class_config(class_config):
+    """Serialize a ClassConfig dictionary with classConfigSchema.
+
+    Schema dumps are comparatively slow and datasources are often built repeatedly from the same
+    configuration, so results are cached; callers always receive their own copy.
+    """
+    return dict(_dump_class_config(**class_config))
+
+
+@lru_cache(maxsize=32)
+def _dump_class_config(class_name, module_name=None):
+    return classConfigSchema.dump(ClassConfig(class_name, module_name))
@@ -7,6 +7,12 @@ import pytest
 from click.testing import CliRunner
 from great_expectations import DataContext
 from great_expectations.cli import cli
+from great_expectations.cli.checkpoint import (
+    _can_load_batches_concurrently,
+    _can_load_suites_concurrently,
+    _load_checkpoint_yml_template,
+    _load_expectation_suites,
+)
 from ruamel.yaml import YAML
 from tests.cli.utils import assert_no_logging_messages_or_tracebacks
 
@@ -796,6 +802,34 @@ def test_checkpoint_script_happy_path_generates_script(
     assert_no_logging_messages_or_tracebacks(caplog, result)
 
 
+@mock.patch("great_expectations.cli.checkpoint.lint_code")
+def test_checkpoint_script_only_lints_when_requested(
+    mock_lint_code, caplog, titanic_data_context_with_checkpoint_suite_and_stats_enabled
+):
+    context = titanic_data_context_with_checkpoint_suite_and_stats_enabled
+    root_dir = context.root_directory
+    mock_lint_code.side_effect = lambda code: code
+    runner = CliRunner(mix_stderr=False)
+
+    result = runner.invoke(
+        cli, f"checkpoint script my_checkpoint -d {root_dir}", catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert mock_lint_code.call_count == 0
+
+    os.remove(
+        os.path.join(root_dir, context.GE_UNCOMMITTED_DIR, "run_my_checkpoint.py")
+    )
+    result = runner.invoke(
+        cli,
+        f"checkpoint script my_checkpoint -d {root_dir} --lint",
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert mock_lint_code.call_count == 1
+    assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
 def test_checkpoint_script_happy_path_executable_successful_validation(
     caplog, titanic_data_context_with_checkpoint_suite_and_stats_enabled
 ):
@@ -893,6 +927,73 @@ def test_checkpoint_script_happy_path_executable_failed_validation(
     assert output == "Validation Failed!"
 
 
+def test_load_checkpoint_yml_template_returns_independent_copies():
+    template = _load_checkpoint_yml_template()
+    template["batches"][0]["batch_kwargs"] = {"path": "/foo/bar.csv"}
+
+    fresh = _load_checkpoint_yml_template()
+    assert fresh["batches"][0]["batch_kwargs"]["path"] == "/path/to/npi.csv"
+
+
+def test_can_load_batches_concurrently_only_for_pandas_path_batches(
+    titanic_data_context_stats_enabled,
+):
+    context = titanic_data_context_stats_enabled
+    path_kwargs = {"path": "/tmp/Titanic.csv", "datasource": "mydatasource"}
+    assert _can_load_batches_concurrently(context, [path_kwargs, path_kwargs])
+
+    s3_kwargs = {"s3": "s3://bucket/Titanic.csv", "datasource": "mydatasource"}
+    assert not _can_load_batches_concurrently(context, [path_kwargs, s3_kwargs])
+
+    unknown_kwargs = {"path": "/tmp/Titanic.csv", "datasource": "not_a_datasource"}
+    assert not _can_load_batches_concurrently(context, [unknown_kwargs])
+
+
+def test_load_expectation_suites_loads_each_suite_once(
+    titanic_data_context_stats_enabled, titanic_expectation_suite
+):
+    context = titanic_data_context_stats_enabled
+    context.save_expectation_suite(titanic_expectation_suite)
+
+    with mock.patch.object(
+        context, "get_expectation_suite", wraps=context.get_expectation_suite
+    ) as mock_get_suite:
+        suite_map = _load_expectation_suites(
+            context,
+            ["Titanic.warning", "Titanic.warning.json", "Titanic.warning"],
+            "cli.checkpoint.run",
+        )
+
+    assert sorted(suite_map.keys()) == ["Titanic.warning", "Titanic.warning.json"]
+    for suite in suite_map.values():
+        assert suite.expectation_suite_name == "Titanic.warning"
+    assert mock_get_suite.call_count == 2
+
+
+def test_load_expectation_suites_serially_unless_store_is_on_filesystem(
+    titanic_data_context_stats_enabled, titanic_expectation_suite
+):
+    context = titanic_data_context_stats_enabled
+    context.save_expectation_suite(titanic_expectation_suite)
+    expectations_store = context.stores[context.expectations_store_name]
+    assert _can_load_suites_concurrently(context)
+
+    with mock.patch.object(expectations_store, "_store_backend", mock.Mock()):
+        assert not _can_load_suites_concurrently(context)
+
+    with mock.patch(
+        "great_expectations.cli.checkpoint._can_load_suites_concurrently",
+        return_value=False,
+    ), mock.patch(
+        "great_expectations.cli.checkpoint.ThreadPoolExecutor"
+    ) as mock_executor:
+        suite_map = _load_expectation_suites(
+            context, ["Titanic.warning.json"], "cli.checkpoint.run"
+        )
+    assert mock_executor.call_count == 0
+    assert suite_map["Titanic.warning.json"].expectation_suite_name == "Titanic.warning"
+
+
 def _write_checkpoint_dict_to_file(bad, checkpoint_file_path):
     yaml = YAML()
     with open(checkpoint_file_path, "w") as f:
@@ -1,4 +1,9 @@
+import copy
+import json
 import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from freezegun import freeze_time
@@ -66,3 +71,71 @@ def test_batch_kwargs_attributes_and_keys():
     ]
     test_batch_kwargs["path"] = "/a/new/path.csv"
     assert test_batch_kwargs.path == "/a/new/path.csv"
+
+
+def test_batch_markers_lazy_values_resolve_when_serialized():
+    batch_markers = BatchMarkers({"ge_load_time": "20200101T000000.000000Z"})
+    batch_markers.set_lazy("pandas_data_fingerprint", lambda: "fingerprint")
+    assert (
+        batch_markers.to_id()
+        == BatchMarkers(
+            {
+                "ge_load_time": "20200101T000000.000000Z",
+                "pandas_data_fingerprint": "fingerprint",
+            }
+        ).to_id()
+    )
+    assert dict(batch_markers) == {
+        "ge_load_time": "20200101T000000.000000Z",
+        "pandas_data_fingerprint": "fingerprint",
+    }
+
+    batch_markers = BatchMarkers({"ge_load_time": "20200101T000000.000000Z"})
+    batch_markers.set_lazy("pandas_data_fingerprint", lambda: "fingerprint")
+    assert json.loads(json.dumps(batch_markers)) == {
+        "ge_load_time": "20200101T000000.000000Z",
+        "pandas_data_fingerprint": "fingerprint",
+    }
+
+    for make_copy in [
+        copy.copy,
+        copy.deepcopy,
+        lambda m: pickle.loads(pickle.dumps(m)),
+    ]:
+        batch_markers = BatchMarkers({"ge_load_time": "20200101T000000.000000Z"})
+        batch_markers.set_lazy("pandas_data_fingerprint", lambda: "fingerprint")
+        copied = make_copy(batch_markers)
+        assert isinstance(copied, BatchMarkers)
+        assert dict.__getitem__(copied, "pandas_data_fingerprint") == "fingerprint"
+
+
+@pytest.mark.parametrize(
+    "overwrite",
+    [
+        lambda markers: markers.update({"pandas_data_fingerprint": "x"}),
+        lambda markers: markers.update(pandas_data_fingerprint="x"),
+        lambda markers: markers.__setitem__("pandas_data_fingerprint", "x"),
+    ],
+)
+def test_batch_markers_writes_replace_pending_lazy_values(overwrite):
+    compute = mock.Mock(return_value="fingerprint")
+    batch_markers = BatchMarkers({"ge_load_time": "20200101T000000.000000Z"})
+    batch_markers.set_lazy("pandas_data_fingerprint", compute)
+
+    overwrite(batch_markers)
+    assert batch_markers["pandas_data_fingerprint"] == "x"
+    assert batch_markers.setdefault("pandas_data_fingerprint", "y") == "x"
+    assert compute.call_count == 0
+
+
+def test_batch_markers_lazy_value_is_computed_once_across_threads():
+    compute = mock.Mock(side_effect=lambda: time.sleep(0.05) or "fingerprint")
+    batch_markers = BatchMarkers({"ge_load_time": "20200101T000000.000000Z"})
+    batch_markers.set_lazy("pandas_data_fingerprint", compute)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(
+            executor.map(lambda _: batch_markers["pandas_data_fingerprint"], range(8))
+        )
+    assert values == ["fingerprint"] * 8
+    assert compute.call_count == 1
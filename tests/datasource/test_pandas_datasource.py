@@ -3,6 +3,7 @@
 import os
 import shutil
 
+import mock
 import pandas as pd
 import pytest
 from great_expectations.core import ExpectationSuite
@@ -15,6 +16,10 @@ from great_expectations.datasource.types.batch_kwargs import (
     BatchMarkers,
     PathBatchKwargs,
 )
+from great_expectations.datasource.util import (
+    hash_pandas_dataframe,
+    sample_hash_pandas_dataframe,
+)
 from great_expectations.exceptions import BatchKwargsError
 from great_expectations.validator.validator import Validator
 from ruamel.yaml import YAML
@@ -355,3 +360,293 @@ def test_pandas_datasource_processes_dataset_options(test_folder_connection_path
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+def test_pandas_datasource_fingerprints(test_folder_connection_path):
+    datasource = PandasDatasource("PandasCSV")
+    path = os.path.join(test_folder_connection_path, "test.csv")
+    batch = datasource.get_batch({"path": path})
+    assert batch.batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(
+        batch.data
+    )
+
+    # An unchanged file is not hashed again
+    with mock.patch(
+        "great_expectations.datasource.pandas_datasource.hash_pandas_dataframe"
+    ) as mock_hash:
+        cached_batch = datasource.get_batch({"path": path})
+    assert mock_hash.call_count == 0
+    assert (
+        cached_batch.batch_markers["pandas_data_fingerprint"]
+        == batch.batch_markers["pandas_data_fingerprint"]
+    )
+
+    df = pd.DataFrame({"col_1": range(5000)})
+    batch = datasource.get_batch({"dataset": df})
+    assert batch.batch_markers[
+        "pandas_data_fingerprint"
+    ] == sample_hash_pandas_dataframe(df)
+
+    batch = datasource.get_batch({"dataset": df, "full_fingerprint": True})
+    assert batch.batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(df)
+
+    series = df["col_1"]
+    batch = datasource.get_batch({"dataset": series, "full_fingerprint": True})
+    assert batch.batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(
+        series
+    )
+
+
+@mock.patch(
+    "great_expectations.datasource.pandas_datasource.PATH_FINGERPRINT_CACHE_SIZE", 2
+)
+def test_pandas_datasource_path_fingerprint_cache_is_bounded(tmp_path):
+    from great_expectations.datasource.pandas_datasource import _path_fingerprints
+
+    datasource = PandasDatasource("PandasCSV")
+    paths = [str(tmp_path / f"data_{i}.csv") for i in range(3)]
+    for i, path in enumerate(paths):
+        pd.DataFrame({"col_1": [i]}).to_csv(path, index=False)
+        datasource.get_batch({"path": path})
+
+    assert [key[0] for key in _path_fingerprints.keys()] == paths[1:]
+
+
+def test_pandas_datasource_path_fingerprint_describes_loaded_data(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"col_1": [1, 2, 3]}).to_csv(path, index=False)
+    loaded_fingerprint = hash_pandas_dataframe(pd.read_csv(path))
+
+    datasource = PandasDatasource("PandasCSV")
+    batch = datasource.get_batch({"path": path})
+    dataset = Validator(
+        batch, ExpectationSuite(expectation_suite_name="foo")
+    ).get_dataset()
+    dataset["col_2"] = 0
+    dataset.loc[0, "col_1"] = 100
+
+    assert batch.batch_markers["pandas_data_fingerprint"] == loaded_fingerprint
+    fresh_batch = datasource.get_batch({"path": path})
+    assert fresh_batch.batch_markers["pandas_data_fingerprint"] == loaded_fingerprint
+
+
+def test_pandas_datasource_fingerprint_is_computed_on_first_read():
+    datasource = PandasDatasource("PandasCSV")
+    df = pd.DataFrame({"col_1": [1, 2, 3]})
+    with mock.patch(
+        "great_expectations.datasource.pandas_datasource.hash_pandas_dataframe",
+        return_value="fingerprint",
+    ) as mock_hash:
+        batch = datasource.get_batch({"dataset": df, "full_fingerprint": True})
+        assert "pandas_data_fingerprint" in batch.batch_markers
+        assert mock_hash.call_count == 0
+
+        assert batch.batch_markers.get("pandas_data_fingerprint") == "fingerprint"
+        assert batch.batch_markers["pandas_data_fingerprint"] == "fingerprint"
+        assert mock_hash.call_count == 1
+
+
+@pytest.fixture
+def s3_pandas_datasource_bucket():
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+
+    with moto.mock_s3():
+        bucket = "test_bucket"
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=bucket)
+        yield client, bucket
+
+
+def test_s3_pandas_source_read_csv(s3_pandas_datasource_bucket):
+    client, bucket = s3_pandas_datasource_bucket
+    df = pd.DataFrame({"col_1": [1, 2, 3], "col_2": ["a", "ü", "c"]})
+    client.put_object(
+        Bucket=bucket, Body=df.to_csv(index=False).encode("utf-8"), Key="data.csv"
+    )
+
+    datasource = PandasDatasource(
+        "PandasS3", boto3_options={"region_name": "us-east-1"}
+    )
+    batch = datasource.get_batch({"s3": f"s3://{bucket}/data.csv"})
+    assert batch.data.equals(df)
+
+
+def test_s3_pandas_source_read_parquet(s3_pandas_datasource_bucket):
+    pytest.importorskip("pyarrow")
+    client, bucket = s3_pandas_datasource_bucket
+    df = pd.DataFrame({"col_1": [1, 2, 3], "col_2": ["a", "ü", "c"]})
+    client.put_object(
+        Bucket=bucket, Body=df.to_parquet(index=False), Key="data.parquet"
+    )
+
+    datasource = PandasDatasource(
+        "PandasS3", boto3_options={"region_name": "us-east-1"}
+    )
+    batch = datasource.get_batch({"s3": f"s3://{bucket}/data.parquet"})
+    assert batch.data.equals(df)
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("data.csv", {"reader_method": "read_csv"}),
+        ("DATA.CSV", {"reader_method": "read_csv"}),
+        ("data.tsv", {"reader_method": "read_csv", "reader_options": {"sep": "\t"}}),
+        ("data.parquet", {"reader_method": "read_parquet"}),
+        ("data.xls", {"reader_method": "read_excel"}),
+        ("data.xlsx", {"reader_method": "read_excel"}),
+        ("data.json", {"reader_method": "read_json"}),
+        ("data.pkl", {"reader_method": "read_pickle"}),
+        (
+            "data.csv.gz",
+            {"reader_method": "read_csv", "reader_options": {"compression": "gzip"}},
+        ),
+        (
+            "data.tsv.gz",
+            {
+                "reader_method": "read_csv",
+                "reader_options": {"compression": "gzip", "sep": "\t"},
+            },
+        ),
+    ],
+)
+def test_guess_reader_method_from_path(path, expected):
+    assert PandasDatasource.guess_reader_method_from_path(path) == expected
+
+
+def test_guess_reader_method_from_path_unknown_extension():
+    with pytest.raises(BatchKwargsError, match="Unable to determine reader method"):
+        PandasDatasource.guess_reader_method_from_path("data.gz")
+
+
+@pytest.mark.parametrize(
+    "reader_options", [{}, {"sep": "\t"}, {"delimiter": "\t"}],
+)
+def test_pandas_datasource_reads_tsv(tmp_path, reader_options):
+    path = str(tmp_path / "data.tsv")
+    with open(path, "w") as f:
+        f.write("col_1\tcol_2\n1\ta\n2\tb\n")
+
+    datasource = PandasDatasource("PandasTSV")
+    batch = datasource.get_batch({"path": path, "reader_options": reader_options})
+    assert list(batch.data.columns) == ["col_1", "col_2"]
+    assert len(batch.data) == 2
+
+
+def test_get_reader_fn_is_cached():
+    datasource = PandasDatasource("PandasCSV")
+    reader_fn = datasource._get_reader_fn(path="data.csv.gz")
+    assert reader_fn.func is pd.read_csv
+    assert reader_fn.keywords == {"compression": "gzip"}
+    assert datasource._get_reader_fn(path="other.csv.gz") is reader_fn
+    assert datasource._get_reader_fn(path="data.tsv.gz") is not reader_fn
+
+    assert datasource._get_reader_fn(reader_method="read_csv") is pd.read_csv
+    assert datasource._get_reader_fn(path="data.csv") is pd.read_csv
+
+    with pytest.raises(BatchKwargsError, match="Unable to find reader_method"):
+        datasource._get_reader_fn(reader_method="read_blarg")
+
+
+@mock.patch(
+    "great_expectations.datasource.pandas_datasource._can_read_parquet_from_s3_url",
+    return_value=True,
+)
+def test_s3_pandas_source_reads_parquet_from_url(mock_can_read):
+    df = pd.DataFrame({"col_1": [1, 2, 3]})
+    datasource = PandasDatasource("PandasS3", use_s3fs_for_parquet=True)
+    with mock.patch.object(pd, "read_parquet", return_value=df) as mock_read_parquet:
+        batch = datasource.get_batch(
+            {
+                "s3": "s3://test_bucket/data.parquet",
+                "reader_options": {"columns": ["col_1"]},
+            }
+        )
+        assert batch.data is df
+        mock_read_parquet.assert_called_once_with(
+            "s3://test_bucket/data.parquet",
+            columns=["col_1"],
+            storage_options={"client_kwargs": {}},
+        )
+
+        mock_read_parquet.reset_mock()
+        datasource.get_batch(
+            {
+                "s3": "s3://test_bucket/data.parquet",
+                "reader_options": {"storage_options": {"anon": True}},
+            }
+        )
+        mock_read_parquet.assert_called_once_with(
+            "s3://test_bucket/data.parquet", storage_options={"anon": True}
+        )
+
+
+@mock.patch(
+    "great_expectations.datasource.pandas_datasource._can_read_parquet_from_s3_url",
+    return_value=True,
+)
+def test_s3_pandas_source_reads_parquet_with_boto3_by_default(
+    mock_can_read, s3_pandas_datasource_bucket
+):
+    pytest.importorskip("pyarrow")
+    client, bucket = s3_pandas_datasource_bucket
+    df = pd.DataFrame({"col_1": [1, 2, 3]})
+    client.put_object(
+        Bucket=bucket, Body=df.to_parquet(index=False), Key="data.parquet"
+    )
+
+    datasource = PandasDatasource("PandasS3")
+    with mock.patch.object(pd, "read_parquet", wraps=pd.read_parquet) as mock_read:
+        batch = datasource.get_batch({"s3": f"s3://{bucket}/data.parquet"})
+    assert batch.data.equals(df)
+    assert not isinstance(mock_read.call_args[0][0], str)
+
+
+@mock.patch(
+    "great_expectations.datasource.pandas_datasource._can_read_parquet_from_s3_url",
+    return_value=False,
+)
+def test_s3_pandas_source_use_s3fs_for_parquet_requires_s3fs(mock_can_read):
+    datasource = PandasDatasource("PandasS3", use_s3fs_for_parquet=True)
+    with pytest.raises(BatchKwargsError, match="requires s3fs"):
+        datasource.get_batch({"s3": "s3://test_bucket/data.parquet"})
+
+
+def test_s3_pandas_source_reads_parquet_with_s3fs(monkeypatch):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("s3fs")
+    boto3 = pytest.importorskip("boto3")
+    moto_server = pytest.importorskip("moto.server")
+    if not hasattr(moto_server, "ThreadedMotoServer"):
+        pytest.skip("s3fs uses aiobotocore, which needs a moto server to mock s3")
+    for variable in ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"]:
+        monkeypatch.setenv(variable, "testing")
+
+    server = moto_server.ThreadedMotoServer(port=0)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        endpoint_url = f"http://{host}:{port}"
+        client = boto3.client("s3", region_name="us-east-1", endpoint_url=endpoint_url)
+        client.create_bucket(Bucket="test_bucket")
+        df = pd.DataFrame({"col_1": [1, 2, 3], "col_2": ["a", "b", "c"]})
+        client.put_object(
+            Bucket="test_bucket", Body=df.to_parquet(index=False), Key="data.parquet"
+        )
+
+        datasource = PandasDatasource("PandasS3", use_s3fs_for_parquet=True)
+        batch = datasource.get_batch(
+            {
+                "s3": "s3://test_bucket/data.parquet",
+                "reader_options": {
+                    "columns": ["col_1"],
+                    "storage_options": {
+                        "client_kwargs": {"endpoint_url": endpoint_url}
+                    },
+                },
+            }
+        )
+    finally:
+        server.stop()
+    assert batch.data.equals(df[["col_1"]])
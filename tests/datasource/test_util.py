@@ -1,5 +1,10 @@
 import pandas as pd
-from great_expectations.datasource.util import hash_pandas_dataframe
+from freezegun import freeze_time
+from great_expectations.datasource.util import (
+    get_ge_load_time,
+    hash_pandas_dataframe,
+    sample_hash_pandas_dataframe,
+)
 
 
 def test_hash_pandas_dataframe_hashable_df():
@@ -14,3 +19,29 @@ def test_hash_pandas_dataframe_unhashable_df():
     df1 = pd.DataFrame(data)
     df2 = pd.DataFrame(data)
     assert hash_pandas_dataframe(df1) == hash_pandas_dataframe(df2)
+
+
+def test_sample_hash_pandas_dataframe_small_df_matches_full_hash():
+    df = pd.DataFrame({"col_1": [1, 2, 3]})
+    assert sample_hash_pandas_dataframe(df) == hash_pandas_dataframe(df)
+
+
+def test_sample_hash_pandas_dataframe_large_df():
+    df1 = pd.DataFrame({"col_1": range(10000), "col_2": ["a"] * 10000})
+    df2 = df1.copy()
+    assert sample_hash_pandas_dataframe(df1) == sample_hash_pandas_dataframe(df2)
+
+    df2.loc[0, "col_1"] = -1
+    assert sample_hash_pandas_dataframe(df1) != sample_hash_pandas_dataframe(df2)
+
+    df3 = df1.astype({"col_1": "float64"})
+    assert sample_hash_pandas_dataframe(df1) != sample_hash_pandas_dataframe(df3)
+
+    assert sample_hash_pandas_dataframe(df1["col_1"]) != sample_hash_pandas_dataframe(
+        df3["col_1"]
+    )
+
+
+@freeze_time("2019-09-26 13:42:41.123456")
+def test_get_ge_load_time():
+    assert get_ge_load_time() == "20190926T134241.123456Z"
@@ -1,5 +1,6 @@
 import pytest
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.types.configurations import dump_class_config
 
 
 def test_instantiate_class_from_config():
@@ -161,3 +162,18 @@ def test_instantiate_class_from_config_with_config_defaults():
             "a": "value_from_the_config",
         },
     )
+
+
+def test_dump_class_config_returns_independent_copies():
+    config = {
+        "class_name": "PandasDataset",
+        "module_name": "great_expectations.dataset",
+    }
+    dumped = dump_class_config(config)
+    assert dumped == config
+
+    dumped["module_name"] = "my_module"
+    assert dump_class_config(config) == config
+
+    with pytest.raises(TypeError):
+        dump_class_config({"class_name": "PandasDataset", "foo": "bar"})